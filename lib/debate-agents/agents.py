@@ -10,6 +10,7 @@ FIXED: Corrected memory query parameter name to 'metadata_filter'.
 
 import asyncio
 import os
+import re
 from typing import Annotated, List, Dict, Any, Optional, Set, Callable
 from typing_extensions import TypedDict
 from datetime import datetime
@@ -25,6 +26,12 @@ logger = structlog.get_logger(__name__)
 
 # --- Rate Limit Handling ---
 
+# Markers for 429/ResourceExhausted/quota errors, matched in a single pass
+RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"429|rate limit|quota|resource ?exhausted|too many requests",
+    re.IGNORECASE
+)
+
 async def invoke_with_rate_limit_handling(
     runnable,
     input_data: Dict[str, Any],
@@ -55,18 +62,10 @@ async def invoke_with_rate_limit_handling(
         try:
             return await runnable.ainvoke(input_data)
         except Exception as e:
-            error_str = str(e).lower()
             error_type = type(e).__name__
 
             # Detect rate limit errors (429, ResourceExhausted, quota exceeded)
-            is_rate_limit = any([
-                "429" in error_str,
-                "rate limit" in error_str,
-                "quota" in error_str,
-                "resourceexhausted" in error_str,
-                "resource exhausted" in error_str,
-                "too many requests" in error_str
-            ])
+            is_rate_limit = RATE_LIMIT_ERROR_PATTERN.search(str(e)) is not None
 
             if is_rate_limit and attempt < max_attempts - 1:
                 # Extended exponential backoff: 60s, 120s, 180s
@@ -174,19 +173,24 @@ def filter_messages_for_gemini(messages: List[BaseMessage]) -> List[BaseMessage]
 
 # --- Agent Factory Functions ---
 
+# Cap on the News Analyst report injected into the Fundamentals prompt (~4k tokens at ~4 chars/token)
+NEWS_CONTEXT_MAX_CHARS = 16000
+
 def create_analyst_node(llm, agent_key: str, tools: List[Any], output_field: str) -> Callable:
     """
     Factory function creating data analyst agent nodes.
     """
+    # Template and tool binding are fixed per node, so build the runnable once
+    # here rather than on every tool-loop iteration.
+    prompt_template = ChatPromptTemplate.from_messages([MessagesPlaceholder(variable_name="messages")])
+    runnable = prompt_template | llm.bind_tools(tools) if tools else prompt_template | llm
+
     async def analyst_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
         from src.prompts import get_prompt
         agent_prompt = get_prompt(agent_key)
         if not agent_prompt:
             logger.error(f"Missing prompt for agent: {agent_key}")
             return {output_field: f"Error: Could not load prompt for {agent_key}."}
-        messages_template = [MessagesPlaceholder(variable_name="messages")]
-        prompt_template = ChatPromptTemplate.from_messages(messages_template)
-        runnable = prompt_template | llm.bind_tools(tools) if tools else prompt_template | llm
         try:
             prompts_used = state.get("prompts_used", {})
             prompts_used[output_field] = {"agent_name": agent_prompt.agent_name, "version": agent_prompt.version}
@@ -201,6 +205,9 @@ def create_analyst_node(llm, agent_key: str, tools: List[Any], output_field: str
             if agent_key == "fundamentals_analyst":
                 news_report = state.get("news_report", "")
                 if news_report:
+                    # Keep the report's head (summary first) and bound prompt size for the tool loop
+                    if len(news_report) > NEWS_CONTEXT_MAX_CHARS:
+                        news_report = news_report[:NEWS_CONTEXT_MAX_CHARS] + "... [truncated]"
                     extra_context = f"\n\n### NEWS CONTEXT (Use for Qualitative Growth Scoring)\n{news_report}\n"
 
             # CRITICAL FIX: Include verified company name to prevent hallucination
@@ -88,30 +88,30 @@ class EODHDFetcher:
                     try:
                         data = await response.json()
                     except (ValueError, aiohttp.ContentTypeError) as e:
-                        logger.debug(f"EODHD malformed JSON for {eod_symbol}: {e}")
+                        logger.debug("EODHD malformed JSON for %s: %s", eod_symbol, e)
                         return None
                     return self._parse_fundamentals(data)
                 
                 elif response.status == 429:
-                    logger.error(f"EODHD API Limit Exceeded (429). Disabling EODHD for this session.")
+                    logger.error("EODHD API Limit Exceeded (429). Disabling EODHD for this session.")
                     self._is_exhausted = True
                     return None
                 
                 elif response.status == 402:
-                    logger.warning(f"EODHD Payment Required (402). Access restricted for {eod_symbol}.")
+                    logger.warning("EODHD Payment Required (402). Access restricted for %s.", eod_symbol)
                     # Don't disable globally, might just be this specific exchange
                     return None
                     
                 elif response.status == 404:
-                    logger.debug(f"EODHD data not found for {eod_symbol}")
+                    logger.debug("EODHD data not found for %s", eod_symbol)
                     return None
                     
                 else:
-                    logger.warning(f"EODHD API error {response.status} for {eod_symbol}")
+                    logger.warning("EODHD API error %s for %s", response.status, eod_symbol)
                     return None
                     
         except Exception as e:
-            logger.debug(f"EODHD request failed: {e}")
+            logger.debug("EODHD request failed: %s", e)
             return None
 
     def _parse_fundamentals(self, data: Dict) -> Dict[str, Optional[float]]:
@@ -194,7 +194,7 @@ class EODHDFetcher:
                     output['operatingCashflow'] = self._safe_float(last_report.get('totalCashFromOperatingActivities'))
 
         except Exception as e:
-            logger.warning(f"Error parsing EODHD data structure: {e}")
+            logger.warning("Error parsing EODHD data structure: %s", e)
 
         return output
 
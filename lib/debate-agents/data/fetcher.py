@@ -230,6 +230,9 @@ class SmartMarketDataFetcher:
     """Intelligent multi-source fetcher with unified parallel approach."""
     
     REQUIRED_BASICS = ['symbol', 'currentPrice', 'currency']
+
+    # Any of these satisfies the price requirement, in order of preference
+    PRICE_FIELDS = ('currentPrice', 'regularMarketPrice', 'previousClose')
     
     IMPORTANT_FIELDS = [
         'marketCap', 'trailingPE', 'priceToBook', 'returnOnEquity',
@@ -237,6 +240,18 @@ class SmartMarketDataFetcher:
         'debtToEquity', 'currentRatio', 'freeCashflow', 'operatingCashflow',
         'numberOfAnalystOpinions', 'pegRatio', 'forwardPE'
     ]
+
+    # Ordered: gap reports list fields in this order
+    CRITICAL_FIELDS = (
+        'trailingPE', 'forwardPE', 'priceToBook', 'pegRatio',
+        'returnOnEquity', 'returnOnAssets', 'debtToEquity',
+        'currentRatio', 'operatingMargins', 'grossMargins',
+        'profitMargins', 'revenueGrowth', 'earningsGrowth',
+        'operatingCashflow', 'freeCashflow', 'numberOfAnalystOpinions'
+    )
+
+    # Too error-prone to take from web search snippets
+    TAVILY_UNSAFE_FIELDS = frozenset({'trailingPE', 'forwardPE', 'pegRatio', 'currentPrice', 'marketCap'})
     
     def __init__(self):
         self.fx_cache = {}
@@ -412,22 +427,16 @@ class SmartMarketDataFetcher:
             ticker = yf.Ticker(symbol)
             info = {}
             try:
-                info = ticker.info
+                # ticker.info is a blocking HTTP call; keep it off the event loop
+                info = await asyncio.to_thread(getattr, ticker, 'info')
             except Exception:
                 info = {}
             
-            has_price = False
-            price_fields = ['currentPrice', 'regularMarketPrice', 'previousClose']
-            
-            if info:
-                for field in price_fields:
-                    if field in info and info[field] is not None:
-                        has_price = True
-                        break
+            has_price = bool(info) and any(info.get(field) is not None for field in self.PRICE_FIELDS)
             
             if not has_price and hasattr(ticker, 'fast_info'):
                 try:
-                    fast_price = ticker.fast_info.get('lastPrice')
+                    fast_price = await asyncio.to_thread(ticker.fast_info.get, 'lastPrice')
                     if fast_price:
                         info['currentPrice'] = fast_price
                         has_price = True
@@ -439,7 +448,7 @@ class SmartMarketDataFetcher:
                 info = info or {}
             
             # ALWAYS extract from statements
-            statement_data = self._extract_from_financial_statements(ticker, symbol)
+            statement_data = await asyncio.to_thread(self._extract_from_financial_statements, ticker, symbol)
             
             for key, value in statement_data.items():
                 if key.startswith('_'):
@@ -585,24 +594,29 @@ class SmartMarketDataFetcher:
             'alpha_vantage': self._fetch_av_fallback(symbol),
         }
         
-        results = {}
-        for source_name, coro in tasks.items():
+        async def _run_source(source_name: str, coro) -> Optional[Dict]:
             try:
                 # Wait for each task with timeout
                 result = await asyncio.wait_for(coro, timeout=PER_SOURCE_TIMEOUT)
-                results[source_name] = result
                 if result:
                     logger.info(f"{source_name}_success", symbol=symbol, fields=len(result))
                 else:
                     logger.warning(f"{source_name}_returned_none", symbol=symbol)
+                return result
             except asyncio.TimeoutError:
                 logger.warning(f"{source_name}_timeout", symbol=symbol)
-                results[source_name] = None
+                return None
             except Exception as e:
                 logger.warning(f"{source_name}_error", symbol=symbol, error=str(e))
-                results[source_name] = None
-        
-        return results
+                return None
+
+        # Await all sources together; awaiting them one by one serialized the
+        # network round-trips and let one slow source delay all the others.
+        source_results = await asyncio.gather(
+            *(_run_source(name, coro) for name, coro in tasks.items())
+        )
+
+        return dict(zip(tasks.keys(), source_results))
 
     def _smart_merge_with_quality(self, source_results: Dict[str, Optional[Dict]], symbol: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
@@ -689,19 +703,11 @@ class SmartMarketDataFetcher:
 
     def _identify_critical_gaps(self, data: Dict) -> List[str]:
         """Identify which critical fields are missing."""
-        critical = [
-            'trailingPE', 'forwardPE', 'priceToBook', 'pegRatio',
-            'returnOnEquity', 'returnOnAssets', 'debtToEquity',
-            'currentRatio', 'operatingMargins', 'grossMargins',
-            'profitMargins', 'revenueGrowth', 'earningsGrowth',
-            'operatingCashflow', 'freeCashflow', 'numberOfAnalystOpinions'
-        ]
-        return [f for f in critical if f not in data or data[f] is None]
+        return [f for f in self.CRITICAL_FIELDS if data.get(f) is None]
 
     async def _fetch_tavily_gaps(self, symbol: str, missing_fields: List[str]) -> Dict[str, Any]:
         """PHASE 5: Tavily gap-filling."""
-        DANGEROUS_FIELDS = ['trailingPE', 'forwardPE', 'pegRatio', 'currentPrice', 'marketCap']
-        safe_missing_fields = [f for f in missing_fields if f not in DANGEROUS_FIELDS]
+        safe_missing_fields = [f for f in missing_fields if f not in self.TAVILY_UNSAFE_FIELDS]
         
         if 'us_revenue_pct' in missing_fields or 'geographic_revenue' in missing_fields:
              safe_missing_fields.append('us_revenue_pct')
@@ -711,43 +717,51 @@ class SmartMarketDataFetcher:
         
         try:
             import yfinance as yf
-            ticker_obj = yf.Ticker(symbol)
-            company_name = (ticker_obj.info.get('longName') or ticker_obj.info.get('shortName') or symbol)
+            ticker_info = await asyncio.to_thread(getattr, yf.Ticker(symbol), 'info')
+            company_name = (ticker_info.get('longName') or ticker_info.get('shortName') or symbol)
         except:
             company_name = symbol
         
         fields_to_search = safe_missing_fields[:5]
-        search_results = {}
-        
-        for field in fields_to_search:
-            # Map internal field names to search terms
-            field_terms = {
-                'trailingPE': "trailing P/E ratio price earnings",
-                'forwardPE': "forward P/E ratio estimate",
-                'priceToBook': "price to book ratio P/B",
-                'returnOnEquity': "ROE return on equity",
-                'debtToEquity': "debt to equity ratio leverage",
-                'numberOfAnalystOpinions': "analyst coverage count",
-                'revenueGrowth': "revenue growth year over year",
-            }
-            
+
+        # Map internal field names to search terms
+        field_terms = {
+            'trailingPE': "trailing P/E ratio price earnings",
+            'forwardPE': "forward P/E ratio estimate",
+            'priceToBook': "price to book ratio P/B",
+            'returnOnEquity': "ROE return on equity",
+            'debtToEquity': "debt to equity ratio leverage",
+            'numberOfAnalystOpinions': "analyst coverage count",
+            'revenueGrowth': "revenue growth year over year",
+        }
+
+        async def _search_field(field: str) -> Optional[str]:
             if field == 'us_revenue_pct':
                 query = f'"{company_name}" annual report revenue by geography North America United States'
             else:
                 term = field_terms.get(field, field)
                 query = generate_strict_search_query(symbol, company_name, term)
-            
+
             try:
                 result = await asyncio.wait_for(
                     asyncio.to_thread(self.tavily_client.search, query, max_results=3),
                     timeout=5
                 )
                 if result and 'results' in result:
-                    combined = "\n".join([i.get('content', '') for i in result['results']])
-                    search_results[field] = combined
+                    return "\n".join([i.get('content', '') for i in result['results']])
             except:
                 pass
-        
+            return None
+
+        # Searches are independent blocking HTTP calls - fan them out on worker
+        # threads so total latency is the slowest search, not the sum of all.
+        combined_results = await asyncio.gather(*(_search_field(f) for f in fields_to_search))
+        search_results = {
+            field: combined
+            for field, combined in zip(fields_to_search, combined_results)
+            if combined is not None
+        }
+
         if not search_results: return {}
         
         all_text = "\n\n".join(search_results.values())
@@ -858,7 +872,7 @@ class SmartMarketDataFetcher:
         missing = []
         for field in self.REQUIRED_BASICS:
             if field == 'currentPrice':
-                if not any(k in data for k in ['currentPrice', 'regularMarketPrice', 'previousClose']):
+                if data.keys().isdisjoint(self.PRICE_FIELDS):
                     missing.append('price')
             elif data.get(field) is None:
                 missing.append(field)
@@ -92,7 +92,7 @@ class FMPFetcher:
                     try:
                         data = await response.json()
                     except (ValueError, aiohttp.ContentTypeError) as e:
-                        logger.debug(f"FMP malformed JSON for {endpoint}: {e}")
+                        logger.debug("FMP malformed JSON for %s: %s", endpoint, e)
                         return None
                     self._key_validated = True
                     return data
@@ -104,12 +104,12 @@ class FMPFetcher:
                         raise ValueError("FMP_API_KEY is invalid or expired. Check your configuration.")
                     else:
                         # Key was valid before, might be rate limit
-                        logger.warning(f"FMP 403 error for {endpoint} (possible rate limit)")
+                        logger.warning("FMP 403 error for %s (possible rate limit)", endpoint)
                         return None
                         
                 else:
                     # Other HTTP errors - log at debug level
-                    logger.debug(f"FMP API returned {response.status} for {endpoint}")
+                    logger.debug("FMP API returned %s for %s", response.status, endpoint)
                     return None
                     
         except ValueError:
@@ -117,11 +117,11 @@ class FMPFetcher:
             raise
         except aiohttp.ClientError as e:
             # Network errors - log at debug level
-            logger.debug(f"FMP network error for {endpoint}: {e}")
+            logger.debug("FMP network error for %s: %s", endpoint, e)
             return None
         except Exception as e:
             # Unexpected errors - log at debug level
-            logger.debug(f"FMP request failed for {endpoint}: {e}")
+            logger.debug("FMP request failed for %s: %s", endpoint, e)
             return None
     
     async def get_financial_metrics(self, symbol: str) -> Dict[str, Optional[float]]:
@@ -200,7 +200,7 @@ class FMPFetcher:
         
         # Log if we got no data at all
         if all(v is None for k, v in result.items() if k != '_source'):
-            logger.debug(f"FMP returned no data for {symbol}")
+            logger.debug("FMP returned no data for %s", symbol)
         
         return result
 
@@ -10,6 +10,7 @@ Provides "vague sentiment" signal for ex-US equities through:
 NO paid APIs required beyond existing Tavily.
 """
 
+import asyncio
 from typing import Annotated, Dict, List, Optional
 import structlog
 from langchain_core.tools import tool
@@ -154,7 +155,7 @@ async def get_multilingual_sentiment_search(
     Uses Tavily web search with smart query construction.
     """
     
-    output = f"""
+    output_parts = [f"""
 ========================================
 MULTILINGUAL SENTIMENT SEARCH
 ========================================
@@ -164,33 +165,66 @@ Company: {company_name}
 This is a BEST EFFORT search for sentiment signals using publicly accessible
 platforms. Results are directional indicators, not comprehensive sentiment.
 
-"""
+"""]
     
     # Get translations
     translations = get_company_translations(ticker, company_name)
     region = detect_market_region(ticker)
     
-    output += f"""
+    output_parts.append(f"""
 **Company Names**:
 - English: {company_name}
 - Local: {translations.get('native', 'N/A')}
 - Romanized: {translations.get('romanized', 'N/A')}
 - Market Region: {region}
 
-"""
+""")
     
     sentiment_signals = []
     
+    # Build every tier's query up front; the searches are independent, so run
+    # them concurrently and then report each tier in order below
+    # TradingView (has international stocks)
+    tradingview_query = f'site:tradingview.com {ticker} OR "{company_name}" sentiment OR bullish OR bearish'
+    # Investing.com (has comments for international stocks)
+    investing_query = f'site:investing.com {ticker} comments OR sentiment'
+    
+    native_name = translations.get('native', '')
+    # Native language company name
+    multilang_query = None
+    if native_name and native_name != company_name:
+        multilang_query = f'"{native_name}" {ticker} 股票 OR stock OR sentiment'
+    
+    # Major regional English-language financial news
+    region_query = None
+    if region in REGION_PLATFORMS:
+        platforms = REGION_PLATFORMS[region]
+        region_sites = " OR ".join(f"site:{site}" for site in platforms[:3])
+        region_query = f'({region_sites}) "{company_name}" OR {ticker}'
+    
+    async def _search(query: Optional[str]):
+        if query is None:
+            return None
+        return await tavily_tool.ainvoke({"query": query})
+    
+    # Failures come back as exceptions and are reported per tier
+    tv_result, inv_result, ml_result, region_result = await asyncio.gather(
+        _search(tradingview_query),
+        _search(investing_query),
+        _search(multilang_query),
+        _search(region_query),
+        return_exceptions=True
+    )
+    
     # ===== TIER 1: ACCESSIBLE PLATFORM SEARCHES =====
-    output += "\n### Tier 1: Accessible Platform Searches\n\n"
+    output_parts.append("\n### Tier 1: Accessible Platform Searches\n\n")
     
     try:
-        # Search TradingView (has international stocks)
-        tradingview_query = f'site:tradingview.com {ticker} OR "{company_name}" sentiment OR bullish OR bearish'
-        tv_result = await tavily_tool.ainvoke({"query": tradingview_query})
+        if isinstance(tv_result, Exception):
+            raise tv_result
         
-        output += f"**TradingView Search**:\n"
-        output += f"Query: `{tradingview_query}`\n"
+        output_parts.append(f"**TradingView Search**:\n")
+        output_parts.append(f"Query: `{tradingview_query}`\n")
         
         # Parse results for sentiment keywords
         tv_text = str(tv_result).lower()
@@ -205,22 +239,22 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                 "bearish": bearish_count,
                 "ratio": sentiment_ratio
             })
-            output += f"Sentiment Keywords: Bullish={bullish_count}, Bearish={bearish_count}\n"
+            output_parts.append(f"Sentiment Keywords: Bullish={bullish_count}, Bearish={bearish_count}\n")
         else:
-            output += "No clear sentiment signals found.\n"
+            output_parts.append("No clear sentiment signals found.\n")
         
-        output += "\n"
+        output_parts.append("\n")
         
     except Exception as e:
-        output += f"TradingView search failed: {str(e)}\n\n"
+        output_parts.append(f"TradingView search failed: {str(e)}\n\n")
     
-    # Search Investing.com (has comments for international stocks)
+    # Investing.com results
     try:
-        investing_query = f'site:investing.com {ticker} comments OR sentiment'
-        inv_result = await tavily_tool.ainvoke({"query": investing_query})
+        if isinstance(inv_result, Exception):
+            raise inv_result
         
-        output += f"**Investing.com Search**:\n"
-        output += f"Query: `{investing_query}`\n"
+        output_parts.append(f"**Investing.com Search**:\n")
+        output_parts.append(f"Query: `{investing_query}`\n")
         
         inv_text = str(inv_result).lower()
         bullish_count = inv_text.count("buy") + inv_text.count("bullish") + inv_text.count("strong buy")
@@ -234,33 +268,30 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                 "bearish": bearish_count,
                 "ratio": sentiment_ratio
             })
-            output += f"Sentiment Keywords: Bullish={bullish_count}, Bearish={bearish_count}\n"
+            output_parts.append(f"Sentiment Keywords: Bullish={bullish_count}, Bearish={bearish_count}\n")
         else:
-            output += "No clear sentiment signals found.\n"
+            output_parts.append("No clear sentiment signals found.\n")
         
-        output += "\n"
+        output_parts.append("\n")
         
     except Exception as e:
-        output += f"Investing.com search failed: {str(e)}\n\n"
+        output_parts.append(f"Investing.com search failed: {str(e)}\n\n")
     
     # ===== TIER 2: MULTILINGUAL SEARCHES =====
-    output += "\n### Tier 2: Multilingual Searches\n\n"
-    
-    native_name = translations.get('native', '')
+    output_parts.append("\n### Tier 2: Multilingual Searches\n\n")
     
-    if native_name and native_name != company_name:
+    if multilang_query:
         try:
-            # Search using native language company name
-            multilang_query = f'"{native_name}" {ticker} 股票 OR stock OR sentiment'
-            ml_result = await tavily_tool.ainvoke({"query": multilang_query})
+            if isinstance(ml_result, Exception):
+                raise ml_result
             
-            output += f"**Native Language Search**:\n"
-            output += f"Query: `{multilang_query}`\n"
+            output_parts.append(f"**Native Language Search**:\n")
+            output_parts.append(f"Query: `{multilang_query}`\n")
             
             # Check if we got any results
             if ml_result and len(str(ml_result)) > 100:
-                output += f"Found {len(str(ml_result))} characters of content.\n"
-                output += "Note: Results may be in local language. Manual review recommended.\n"
+                output_parts.append(f"Found {len(str(ml_result))} characters of content.\n")
+                output_parts.append("Note: Results may be in local language. Manual review recommended.\n")
                 
                 # Try to detect sentiment even in non-English
                 # Common sentiment words across languages
@@ -280,7 +311,7 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                 neg_count = sum(ml_text.count(word) for word in negative_indicators)
                 
                 if pos_count + neg_count > 0:
-                    output += f"Sentiment Indicators: Positive={pos_count}, Negative={neg_count}\n"
+                    output_parts.append(f"Sentiment Indicators: Positive={pos_count}, Negative={neg_count}\n")
                     sentiment_signals.append({
                         "source": "Multilingual Search",
                         "bullish": pos_count,
@@ -288,33 +319,28 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                         "ratio": pos_count / (pos_count + neg_count)
                     })
             else:
-                output += "Limited results found.\n"
+                output_parts.append("Limited results found.\n")
             
-            output += "\n"
+            output_parts.append("\n")
             
         except Exception as e:
-            output += f"Multilingual search failed: {str(e)}\n\n"
+            output_parts.append(f"Multilingual search failed: {str(e)}\n\n")
     else:
-        output += "No native language translation available for enhanced search.\n\n"
+        output_parts.append("No native language translation available for enhanced search.\n\n")
     
     # ===== TIER 3: REGION-SPECIFIC NEWS =====
-    output += "\n### Tier 3: Region-Specific English News\n\n"
+    output_parts.append("\n### Tier 3: Region-Specific English News\n\n")
     
-    if region in REGION_PLATFORMS:
-        platforms = REGION_PLATFORMS[region]
-        
-        # Search major regional English-language financial news
-        region_sites = " OR ".join([f"site:{site}" for site in platforms[:3]])
-        region_query = f'({region_sites}) "{company_name}" OR {ticker}'
-        
+    if region_query:
         try:
-            region_result = await tavily_tool.ainvoke({"query": region_query})
+            if isinstance(region_result, Exception):
+                raise region_result
             
-            output += f"**Regional News Search** ({region.replace('_', ' ').title()}):\n"
-            output += f"Query: `{region_query}`\n"
+            output_parts.append(f"**Regional News Search** ({region.replace('_', ' ').title()}):\n")
+            output_parts.append(f"Query: `{region_query}`\n")
             
             if region_result and len(str(region_result)) > 100:
-                output += f"Found {len(str(region_result))} characters of regional news.\n"
+                output_parts.append(f"Found {len(str(region_result))} characters of regional news.\n")
                 
                 # Analyze tone
                 region_text = str(region_result).lower()
@@ -325,7 +351,7 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                 neg_score = sum(region_text.count(word) for word in negative_words)
                 
                 if pos_score + neg_score > 0:
-                    output += f"News Tone: Positive={pos_score}, Negative={neg_score}\n"
+                    output_parts.append(f"News Tone: Positive={pos_score}, Negative={neg_score}\n")
                     sentiment_signals.append({
                         "source": "Regional News",
                         "bullish": pos_score,
@@ -333,15 +359,15 @@ platforms. Results are directional indicators, not comprehensive sentiment.
                         "ratio": pos_score / (pos_score + neg_score)
                     })
             else:
-                output += "Limited regional news found.\n"
+                output_parts.append("Limited regional news found.\n")
             
-            output += "\n"
+            output_parts.append("\n")
             
         except Exception as e:
-            output += f"Regional news search failed: {str(e)}\n\n"
+            output_parts.append(f"Regional news search failed: {str(e)}\n\n")
     
     # ===== AGGREGATE SENTIMENT SIGNAL =====
-    output += "\n### Aggregated Sentiment Signal\n\n"
+    output_parts.append("\n### Aggregated Sentiment Signal\n\n")
     
     if sentiment_signals:
         # Calculate weighted average
@@ -352,9 +378,9 @@ platforms. Results are directional indicators, not comprehensive sentiment.
         if total_mentions > 0:
             overall_ratio = total_bullish / total_mentions
             
-            output += f"**Total Mentions**: {total_mentions}\n"
-            output += f"**Bullish**: {total_bullish} ({total_bullish/total_mentions*100:.1f}%)\n"
-            output += f"**Bearish**: {total_bearish} ({total_bearish/total_mentions*100:.1f}%)\n\n"
+            output_parts.append(f"**Total Mentions**: {total_mentions}\n")
+            output_parts.append(f"**Bullish**: {total_bullish} ({total_bullish/total_mentions*100:.1f}%)\n")
+            output_parts.append(f"**Bearish**: {total_bearish} ({total_bearish/total_mentions*100:.1f}%)\n\n")
             
             # Classify sentiment
             if overall_ratio > 0.60:
@@ -364,19 +390,19 @@ platforms. Results are directional indicators, not comprehensive sentiment.
             else:
                 sentiment_class = "NEGATIVE"
             
-            output += f"**Aggregate Sentiment**: {sentiment_class}\n"
-            output += f"**Confidence**: {'LOW' if total_mentions < 10 else 'MEDIUM' if total_mentions < 30 else 'HIGH'}\n\n"
+            output_parts.append(f"**Aggregate Sentiment**: {sentiment_class}\n")
+            output_parts.append(f"**Confidence**: {'LOW' if total_mentions < 10 else 'MEDIUM' if total_mentions < 30 else 'HIGH'}\n\n")
             
-            output += "**Sources Breakdown**:\n"
+            output_parts.append("**Sources Breakdown**:\n")
             for signal in sentiment_signals:
-                output += f"- {signal['source']}: {signal['bullish']} bullish, {signal['bearish']} bearish\n"
+                output_parts.append(f"- {signal['source']}: {signal['bullish']} bullish, {signal['bearish']} bearish\n")
         else:
-            output += "Insufficient data to calculate aggregate sentiment.\n"
+            output_parts.append("Insufficient data to calculate aggregate sentiment.\n")
     else:
-        output += "**No sentiment signals detected.**\n"
-        output += "This suggests the stock is truly undiscovered or has minimal online discussion.\n"
+        output_parts.append("**No sentiment signals detected.**\n")
+        output_parts.append("This suggests the stock is truly undiscovered or has minimal online discussion.\n")
     
-    output += """
+    output_parts.append("""
 
 ========================================
 INTERPRETATION GUIDANCE
@@ -401,10 +427,10 @@ INTERPRETATION GUIDANCE
 This is a SUPPLEMENTARY signal. Primary investment decisions should be based
 on fundamental analysis (Financial Health, Growth Transition scores).
 
-"""
+""")
     
     logger.info("multilingual_sentiment_search_completed", 
                 ticker=ticker,
                 signals_found=len(sentiment_signals))
     
-    return output
+    return "".join(output_parts)
@@ -21,6 +21,11 @@ logger = structlog.get_logger(__name__)
 # TIER 1: Dynamic FX Rates (yfinance - always up-to-date)
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Live rates are reused for an hour so repeated conversions within a run
+# (liquidity, market cap, revenue) don't each pay a yfinance round-trip
+FX_CACHE_TTL = timedelta(hours=1)
+_fx_rate_cache: Dict[str, Tuple[float, datetime]] = {}
+
 async def get_fx_rate_yfinance(from_currency: str, to_currency: str = "USD") -> Optional[float]:
     """
     Get live FX rate from yfinance using standard forex pairs.
@@ -42,6 +47,10 @@ async def get_fx_rate_yfinance(from_currency: str, to_currency: str = "USD") ->
     # yfinance forex ticker format: "JPYUSD=X" (from + to + =X)
     fx_ticker = f"{from_currency}{to_currency}=X"
 
+    cached = _fx_rate_cache.get(fx_ticker)
+    if cached and datetime.now() < cached[1]:
+        return cached[0]
+
     try:
         import yfinance as yf
 
@@ -62,6 +71,7 @@ async def get_fx_rate_yfinance(from_currency: str, to_currency: str = "USD") ->
 
         if rate and rate > 0:
             logger.debug("fx_rate_fetched", pair=fx_ticker, rate=rate, source="yfinance")
+            _fx_rate_cache[fx_ticker] = (float(rate), datetime.now() + FX_CACHE_TTL)
             return float(rate)
         else:
             logger.debug("fx_rate_invalid", pair=fx_ticker, rate=rate)
@@ -287,6 +287,10 @@ def get_consultant_llm(
     """
     global _consultant_llm_instance
 
+    # Fast path: already initialized, skip the environment checks
+    if _consultant_llm_instance is not None:
+        return _consultant_llm_instance
+
     # Check if consultant is enabled
     enable_consultant = os.environ.get("ENABLE_CONSULTANT", "true").lower()
     if enable_consultant == "false":
@@ -302,14 +306,13 @@ def get_consultant_llm(
         return None
 
     # Lazy initialization
-    if _consultant_llm_instance is None:
-        try:
-            _consultant_llm_instance = create_consultant_llm(
-                callbacks=callbacks,
-                quick_mode=quick_mode
-            )
-        except Exception as e:
-            logger.error(f"Failed to initialize consultant LLM: {str(e)}")
-            return None
+    try:
+        _consultant_llm_instance = create_consultant_llm(
+            callbacks=callbacks,
+            quick_mode=quick_mode
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize consultant LLM: {str(e)}")
+        return None
 
     return _consultant_llm_instance
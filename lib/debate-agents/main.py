@@ -37,6 +37,8 @@ from src.report_generator import QuietModeReporter
 logger = structlog.get_logger(__name__)
 console = Console()
 
+SEPARATOR = "=" * 80
+
 
 def suppress_all_logging():
     """Suppress all logging output for quiet mode."""
@@ -262,7 +264,7 @@ def display_token_summary():
 
 def display_results(result: dict, ticker: str):
     """Display analysis results in a formatted manner."""
-    console.print("\n" + "="*80)
+    console.print("\n" + SEPARATOR)
     console.print("[bold green]Analysis Complete![/bold green]\n")
 
     # Display token usage first
@@ -312,7 +314,7 @@ def display_results(result: dict, ticker: str):
             console.print()
     
     display_memory_statistics(ticker)
-    console.print("="*80 + "\n")
+    console.print(SEPARATOR + "\n")
 
 
 def save_results_to_file(result: dict, ticker: str) -> Path:
@@ -367,6 +369,10 @@ def save_results_to_file(result: dict, ticker: str) -> Path:
     tracker = get_tracker()
     token_stats = tracker.get_total_stats()
 
+    # Unwrap nested debate states once rather than per field
+    debate_state = result.get("investment_debate_state") or {}
+    risk_state = result.get("risk_debate_state") or {}
+
     save_data = {
         "metadata": {
             "ticker": ticker,
@@ -397,19 +403,19 @@ def save_results_to_file(result: dict, ticker: str) -> Path:
         },
         "investment_analysis": {
             "investment_debate": {
-                "bull_history": result.get("investment_debate_state", {}).get("bull_history", ""),
-                "bear_history": result.get("investment_debate_state", {}).get("bear_history", ""),
-                "debate_rounds": result.get("investment_debate_state", {}).get("count", 0)
+                "bull_history": debate_state.get("bull_history", ""),
+                "bear_history": debate_state.get("bear_history", ""),
+                "debate_rounds": debate_state.get("count", 0)
             },
             "investment_plan": result.get("investment_plan", ""),
             "trader_plan": result.get("trader_investment_plan", "")
         },
         "risk_analysis": {
             "risk_debate": {
-                "risky_perspective": result.get("risk_debate_state", {}).get("current_risky_response", ""),
-                "safe_perspective": result.get("risk_debate_state", {}).get("current_safe_response", ""),
-                "neutral_perspective": result.get("risk_debate_state", {}).get("current_neutral_response", ""),
-                "debate_rounds": result.get("risk_debate_state", {}).get("count", 0)
+                "risky_perspective": risk_state.get("current_risky_response", ""),
+                "safe_perspective": risk_state.get("current_safe_response", ""),
+                "neutral_perspective": risk_state.get("current_neutral_response", ""),
+                "debate_rounds": risk_state.get("count", 0)
             }
         },
         "final_decision": {
@@ -656,6 +662,11 @@ async def main():
         else:
             console.print(f"\n[bold red]Unexpected error:[/bold red] {str(e)}\n")
         sys.exit(1)
+    finally:
+        # Close the shared StockTwits session (only if the toolkit was loaded)
+        toolkit = sys.modules.get("src.toolkit")
+        if toolkit is not None:
+            await toolkit.stocktwits_api.close()
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ allowing agents to learn from past analyses and decisions.
 import asyncio
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional, Any
 import structlog
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -25,6 +25,60 @@ from src.config import config
 
 logger = structlog.get_logger(__name__)
 
+# Shared ChromaDB client (one per process, reused by every collection)
+_chroma_client = None
+
+
+def _get_chroma_client():
+    """Get or create the process-wide persistent ChromaDB client."""
+    global _chroma_client
+    if _chroma_client is None:
+        # CRITICAL: Disable telemetry to prevent ClientStartEvent errors
+        # Required for ChromaDB v0.5.x (may not be needed in v0.6.x+)
+        # Set multiple environment variables for maximum compatibility
+        os.environ["ANONYMIZED_TELEMETRY"] = "False"
+        os.environ["CHROMA_TELEMETRY_ENABLED"] = "False"
+
+        import chromadb
+        from chromadb.config import Settings
+
+        # Initialize persistent client with telemetry explicitly disabled
+        _chroma_client = chromadb.PersistentClient(
+            path=str(config.chroma_persist_directory),
+            settings=Settings(
+                anonymized_telemetry=False,
+                allow_reset=True
+            )
+        )
+    return _chroma_client
+
+
+# Shared embeddings client (validated once, reused by every collection)
+_embeddings = None
+
+
+def _get_embeddings(api_key: str) -> GoogleGenerativeAIEmbeddings:
+    """Get or create the process-wide Gemini embeddings client."""
+    global _embeddings
+    if _embeddings is None:
+        embeddings = GoogleGenerativeAIEmbeddings(
+            model="models/text-embedding-004",
+            google_api_key=api_key,
+            task_type="retrieval_document"  # Optimized for semantic search
+        )
+
+        # Validate embeddings work with a test query (Sync call for init)
+        try:
+            test_embedding = embeddings.embed_query("initialization test")
+            if not test_embedding or len(test_embedding) == 0:
+                raise ValueError("Embedding test returned empty result")
+        except Exception as e:
+            logger.warning(f"Embedding initialization test failed: {e}")
+            # Don't fail completely, might be transient
+
+        _embeddings = embeddings
+    return _embeddings
+
 
 class FinancialSituationMemory:
     """
@@ -63,20 +117,7 @@ class FinancialSituationMemory:
         
         # Initialize Google embeddings
         try:
-            self.embeddings = GoogleGenerativeAIEmbeddings(
-                model="models/text-embedding-004",
-                google_api_key=api_key,
-                task_type="retrieval_document"  # Optimized for semantic search
-            )
-            
-            # Validate embeddings work with a test query (Sync call for init)
-            try:
-                test_embedding = self.embeddings.embed_query("initialization test")
-                if not test_embedding or len(test_embedding) == 0:
-                    raise ValueError("Embedding test returned empty result")
-            except Exception as e:
-                logger.warning(f"Embedding initialization test failed: {e}")
-                # Don't fail completely, might be transient
+            self.embeddings = _get_embeddings(api_key)
             
             logger.info(
                 "embeddings_initialized",
@@ -94,23 +135,7 @@ class FinancialSituationMemory:
         
         # Initialize ChromaDB
         try:
-            # CRITICAL: Disable telemetry to prevent ClientStartEvent errors
-            # Required for ChromaDB v0.5.x (may not be needed in v0.6.x+)
-            # Set multiple environment variables for maximum compatibility
-            os.environ["ANONYMIZED_TELEMETRY"] = "False"
-            os.environ["CHROMA_TELEMETRY_ENABLED"] = "False"
-            
-            import chromadb
-            from chromadb.config import Settings
-            
-            # Initialize persistent client with telemetry explicitly disabled
-            self.chroma_client = chromadb.PersistentClient(
-                path=str(config.chroma_persist_directory),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
-            )
+            self.chroma_client = _get_chroma_client()
             
             # Create or get collection
             self.situation_collection = self.chroma_client.get_or_create_collection(
@@ -171,12 +196,14 @@ class FinancialSituationMemory:
         # Use rate limiter to share RPM quota with LLM calls
         try:
             from src.llms import GLOBAL_RATE_LIMITER
-            async with GLOBAL_RATE_LIMITER:
-                embedding = await self.embeddings.aembed_query(truncated_text)
-        except Exception:
-            # Fallback if rate limiter not available or incompatible (e.g., in tests)
-            # Catch all exceptions to handle import errors, attribute errors, type errors, etc.
-            embedding = await self.embeddings.aembed_query(truncated_text)
+        except ImportError:
+            # Fallback if rate limiter not available (e.g., in tests)
+            GLOBAL_RATE_LIMITER = None
+
+        # InMemoryRateLimiter is not a context manager; take a token explicitly
+        if GLOBAL_RATE_LIMITER is not None:
+            await GLOBAL_RATE_LIMITER.aacquire()
+        embedding = await self.embeddings.aembed_query(truncated_text)
 
         if not embedding or len(embedding) == 0:
             raise ValueError("Empty embedding returned")
@@ -207,11 +234,11 @@ class FinancialSituationMemory:
             return False
         
         try:
-            # Generate embeddings for all situations
-            embeddings = []
-            for situation in situations:
-                emb = await self._get_embedding(situation)
-                embeddings.append(emb)
+            # Generate embeddings concurrently; each _get_embedding call takes a
+            # GLOBAL_RATE_LIMITER token first, so the gather stays within RPM quota
+            embeddings = await asyncio.gather(
+                *(self._get_embedding(situation) for situation in situations)
+            )
             
             # Prepare IDs (use timestamp + index)
             timestamp = datetime.now().isoformat()
@@ -226,8 +253,9 @@ class FinancialSituationMemory:
                     if "timestamp" not in meta:
                         meta["timestamp"] = timestamp
             
-            # Add to collection
-            self.situation_collection.add(
+            # Add to collection (Chroma persists synchronously; keep it off the event loop)
+            await asyncio.to_thread(
+                self.situation_collection.add,
                 ids=ids,
                 embeddings=embeddings,
                 documents=situations,
@@ -286,7 +314,7 @@ class FinancialSituationMemory:
             if metadata_filter:
                 query_kwargs["where"] = metadata_filter
             
-            results = self.situation_collection.query(**query_kwargs)
+            results = await asyncio.to_thread(self.situation_collection.query, **query_kwargs)
             
             # Format results
             formatted_results = []
@@ -346,19 +374,15 @@ class FinancialSituationMemory:
         if not results:
             return f"No relevant past memories found for {ticker}."
         
-        # Format results
-        memory_text = f"Relevant past memories for {ticker}:\n\n"
-        for i, result in enumerate(results, 1):
-            meta = result['metadata']
-            doc = result['document']
-            dist = result['distance']
-            
-            memory_text += f"### Memory {i} (similarity: {1-dist:.2%})\n"
-            memory_text += f"Date: {meta.get('timestamp', 'Unknown')}\n"
-            memory_text += f"Ticker: {meta.get('ticker', 'Unknown')}\n"
-            memory_text += f"{doc[:500]}...\n\n"
-        
-        return memory_text
+        # Format results: one block per memory, joined in a single pass
+        blocks = [
+            f"### Memory {i} (similarity: {1 - result['distance']:.2%})\n"
+            f"Date: {result['metadata'].get('timestamp', 'Unknown')}\n"
+            f"Ticker: {result['metadata'].get('ticker', 'Unknown')}\n"
+            f"{result['document'][:500]}...\n\n"
+            for i, result in enumerate(results, 1)
+        ]
+        return f"Relevant past memories for {ticker}:\n\n" + "".join(blocks)
     
     def clear_old_memories(self, days_to_keep: int = 90, ticker: Optional[str] = None) -> Dict[str, int]:
         """
@@ -374,98 +398,8 @@ class FinancialSituationMemory:
         Returns:
             Dict of collection_name -> documents_deleted
         """
-        results = {}
-        
-        try:
-            import chromadb
-            from chromadb.config import Settings
-            
-            client = chromadb.PersistentClient(
-                path=str(config.chroma_persist_directory),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
-            )
-            
-            collections = client.list_collections()
-            
-            # Calculate ticker prefix if provided
-            target_prefix = None
-            if ticker:
-                target_prefix = sanitize_ticker_for_collection(ticker)
-                logger.info(f"Scoping memory cleanup to ticker prefix: {target_prefix}")
-            
-            for collection_item in collections:
-                try:
-                    # --- FIX FOR CHROMA 0.6.0+ COMPATIBILITY ---
-                    if isinstance(collection_item, str):
-                        collection = client.get_collection(collection_item)
-                        collection_name = collection_item
-                    else:
-                        collection = collection_item
-                        collection_name = collection.name
-                    # -------------------------------------------
-                    
-                    # Filter by ticker if requested
-                    if target_prefix and not collection_name.startswith(target_prefix):
-                        continue
-
-                    if days_to_keep == 0:
-                        # Delete entire collection
-                        count = collection.count()
-                        client.delete_collection(collection_name)
-                        results[collection_name] = count
-                        logger.info(
-                            "collection_deleted",
-                            name=collection_name,
-                            documents_deleted=count
-                        )
-                    else:
-                        # Delete old documents
-                        from datetime import timedelta
-                        
-                        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-                        cutoff_iso = cutoff_date.isoformat()
-                        
-                        all_docs = collection.get()
-                        ids_to_delete = []
-                        
-                        if all_docs and 'metadatas' in all_docs:
-                            for doc_id, metadata in zip(all_docs['ids'], all_docs['metadatas']):
-                                timestamp = metadata.get('timestamp', '')
-                                if timestamp and timestamp < cutoff_iso:
-                                    ids_to_delete.append(doc_id)
-                        
-                        if ids_to_delete:
-                            collection.delete(ids=ids_to_delete)
-                            results[collection_name] = len(ids_to_delete)
-                            logger.info(
-                                "old_documents_deleted",
-                                collection=collection_name,
-                                count=len(ids_to_delete),
-                                days_kept=days_to_keep
-                            )
-                        else:
-                            results[collection_name] = 0
-                            
-                except Exception as e:
-                    # Try to get name for logging
-                    name = getattr(collection_item, 'name', str(collection_item))
-                    logger.error(
-                        "collection_cleanup_failed",
-                        collection=name,
-                        error=str(e)
-                    )
-                    results[name] = 0
-                    
-        except Exception as e:
-            logger.error(
-                "cleanup_all_memories_failed",
-                error=str(e)
-            )
-        
-        return results
+        # Same sweep as the module-level helper; keep a single implementation
+        return cleanup_all_memories(days=days_to_keep, ticker=ticker)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -620,16 +554,7 @@ def cleanup_all_memories(days: int = 0, ticker: Optional[str] = None) -> Dict[st
     results = {}
     
     try:
-        import chromadb
-        from chromadb.config import Settings
-        
-        client = chromadb.PersistentClient(
-            path=str(config.chroma_persist_directory),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
-            )
-        )
+        client = _get_chroma_client()
         
         collections = client.list_collections()
         
@@ -638,6 +563,9 @@ def cleanup_all_memories(days: int = 0, ticker: Optional[str] = None) -> Dict[st
         if ticker:
             target_prefix = sanitize_ticker_for_collection(ticker)
             logger.info(f"Scoping memory cleanup to ticker prefix: {target_prefix}")
+
+        # One cutoff for the whole sweep (ISO strings compare chronologically)
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat() if days else None
         
         for collection_item in collections:
             try:
@@ -666,17 +594,12 @@ def cleanup_all_memories(days: int = 0, ticker: Optional[str] = None) -> Dict[st
                     )
                 else:
                     # Delete old documents
-                    from datetime import timedelta
-                    
-                    cutoff_date = datetime.now() - timedelta(days=days)
-                    cutoff_iso = cutoff_date.isoformat()
-                    
-                    all_docs = collection.get()
+                    all_docs = collection.get(include=["metadatas"])
                     ids_to_delete = []
                     
-                    if all_docs and 'metadatas' in all_docs:
+                    if all_docs and all_docs.get('metadatas'):
                         for doc_id, metadata in zip(all_docs['ids'], all_docs['metadatas']):
-                            timestamp = metadata.get('timestamp', '')
+                            timestamp = (metadata or {}).get('timestamp', '')
                             if timestamp and timestamp < cutoff_iso:
                                 ids_to_delete.append(doc_id)
                     
@@ -721,16 +644,7 @@ def get_all_memory_stats() -> Dict[str, Dict[str, Any]]:
     stats = {}
     
     try:
-        import chromadb
-        from chromadb.config import Settings
-        
-        client = chromadb.PersistentClient(
-            path=str(config.chroma_persist_directory),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
-            )
-        )
+        client = _get_chroma_client()
         
         collections = client.list_collections()
         
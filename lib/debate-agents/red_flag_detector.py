@@ -21,6 +21,43 @@ from enum import Enum
 
 logger = structlog.get_logger(__name__)
 
+# Report-parsing patterns, compiled once. Metric pattern tuples are tried in order
+# (most specific first); the first match wins.
+SECTOR_PATTERN = re.compile(r'SECTOR:\s*(.+?)(?:\n|$)')
+DATA_BLOCK_PATTERN = re.compile(r'### --- START DATA_BLOCK ---(.+?)### --- END DATA_BLOCK ---', re.DOTALL)
+HEALTH_SCORE_PATTERN = re.compile(r'ADJUSTED_HEALTH_SCORE:\s*(\d+(?:\.\d+)?)%')
+PE_RATIO_PATTERN = re.compile(r'PE_RATIO_TTM:\s*([0-9.]+)')
+
+_METRIC_FLAGS = re.IGNORECASE | re.MULTILINE
+
+DEBT_TO_EQUITY_PATTERNS = tuple(re.compile(p, _METRIC_FLAGS) for p in (
+    r'(?:^|\n)\s*-?\s*D/E:\s*([0-9.]+)',
+    r'(?:^|\n)\s*-?\s*Debt/Equity:\s*([0-9.]+)',
+    r'(?:^|\n)\s*-?\s*Debt-to-Equity:\s*([0-9.]+)',
+    r'D/E:\s*([0-9.]+)',
+    r'Debt/Equity:\s*([0-9.]+)',
+))
+
+INTEREST_COVERAGE_PATTERNS = tuple(re.compile(p, _METRIC_FLAGS) for p in (
+    r'\*\*Interest Coverage\*\*:\s*([0-9.]+)x?',
+    r'Interest Coverage:\s*([0-9.]+)x?',
+    r'Interest Coverage Ratio:\s*([0-9.]+)x?',
+))
+
+FREE_CASH_FLOW_PATTERNS = tuple(re.compile(p, _METRIC_FLAGS) for p in (
+    r'\*\*Free Cash Flow\*\*:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'(?:^|\n)\s*Free Cash Flow:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'(?:^|\n)\s*FCF:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'(?:Free Cash Flow|FCF):\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'Positive FCF:\s*\$?\s*([0-9,.]+)\s*([BMK])?',  # No negative for "Positive"
+))
+
+NET_INCOME_PATTERNS = tuple(re.compile(p, _METRIC_FLAGS) for p in (
+    r'\*\*Net Income\*\*:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'(?:^|\n)\s*Net Income:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+    r'Net Income:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
+))
+
 
 class Sector(Enum):
     """Sector classifications for sector-aware red flag detection."""
@@ -58,7 +95,7 @@ class RedFlagDetector:
             return Sector.GENERAL
 
         # Extract SECTOR from DATA_BLOCK
-        sector_match = re.search(r'SECTOR:\s*(.+?)(?:\n|$)', fundamentals_report)
+        sector_match = SECTOR_PATTERN.search(fundamentals_report)
 
         if not sector_match:
             logger.debug("no_sector_found_in_report", fallback="GENERAL")
@@ -119,8 +156,7 @@ class RedFlagDetector:
             return metrics
 
         # Extract the LAST DATA_BLOCK (agent self-correction pattern)
-        data_block_pattern = r'### --- START DATA_BLOCK ---(.+?)### --- END DATA_BLOCK ---'
-        blocks = list(re.finditer(data_block_pattern, fundamentals_report, re.DOTALL))
+        blocks = list(DATA_BLOCK_PATTERN.finditer(fundamentals_report))
 
         if not blocks:
             logger.warning("no_data_block_found_in_fundamentals_report")
@@ -130,12 +166,12 @@ class RedFlagDetector:
         data_block = blocks[-1].group(1)
 
         # Extract ADJUSTED_HEALTH_SCORE (percentage)
-        health_match = re.search(r'ADJUSTED_HEALTH_SCORE:\s*(\d+(?:\.\d+)?)%', data_block)
+        health_match = HEALTH_SCORE_PATTERN.search(data_block)
         if health_match:
             metrics['adjusted_health_score'] = float(health_match.group(1))
 
         # Extract PE_RATIO_TTM
-        pe_match = re.search(r'PE_RATIO_TTM:\s*([0-9.]+)', data_block)
+        pe_match = PE_RATIO_PATTERN.search(data_block)
         if pe_match:
             metrics['pe_ratio'] = float(pe_match.group(1))
 
@@ -163,15 +199,8 @@ class RedFlagDetector:
         Returns:
             D/E ratio as percentage (e.g., 250.0), or None if not found
         """
-        patterns = [
-            r'(?:^|\n)\s*-?\s*D/E:\s*([0-9.]+)',
-            r'(?:^|\n)\s*-?\s*Debt/Equity:\s*([0-9.]+)',
-            r'(?:^|\n)\s*-?\s*Debt-to-Equity:\s*([0-9.]+)',
-            r'D/E:\s*([0-9.]+)',
-            r'Debt/Equity:\s*([0-9.]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, report, re.IGNORECASE | re.MULTILINE)
+        for pattern in DEBT_TO_EQUITY_PATTERNS:
+            match = pattern.search(report)
             if match:
                 value = float(match.group(1))
                 # Convert to percentage if < 10 (assume ratio like 2.5 -> 250%)
@@ -193,13 +222,8 @@ class RedFlagDetector:
         Returns:
             Interest coverage ratio (e.g., 3.5), or None if not found
         """
-        patterns = [
-            r'\*\*Interest Coverage\*\*:\s*([0-9.]+)x?',
-            r'Interest Coverage:\s*([0-9.]+)x?',
-            r'Interest Coverage Ratio:\s*([0-9.]+)x?',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, report, re.IGNORECASE | re.MULTILINE)
+        for pattern in INTEREST_COVERAGE_PATTERNS:
+            match = pattern.search(report)
             if match:
                 return float(match.group(1))
         return None
@@ -221,15 +245,8 @@ class RedFlagDetector:
         Returns:
             FCF in dollars (e.g., 1_500_000_000), or None if not found
         """
-        patterns = [
-            r'\*\*Free Cash Flow\*\*:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'(?:^|\n)\s*Free Cash Flow:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'(?:^|\n)\s*FCF:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'(?:Free Cash Flow|FCF):\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'Positive FCF:\s*\$?\s*([0-9,.]+)\s*([BMK])?',  # No negative for "Positive"
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, report, re.IGNORECASE | re.MULTILINE)
+        for pattern in FREE_CASH_FLOW_PATTERNS:
+            match = pattern.search(report)
             if match:
                 groups = match.groups()
                 # Handle two different pattern structures
@@ -270,13 +287,8 @@ class RedFlagDetector:
         Returns:
             Net income in dollars (e.g., 500_000_000), or None if not found
         """
-        patterns = [
-            r'\*\*Net Income\*\*:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'(?:^|\n)\s*Net Income:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-            r'Net Income:\s*([+-]?)\$?\s*([0-9,.]+)\s*([BMK])?',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, report, re.IGNORECASE | re.MULTILINE)
+        for pattern in NET_INCOME_PATTERNS:
+            match = pattern.search(report)
             if match:
                 groups = match.groups()
                 sign = groups[0]  # '+' or '-' or ''
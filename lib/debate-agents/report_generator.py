@@ -16,6 +16,19 @@ import re
 # Local import for utility function to avoid circular dependency at module level
 # We import inside the method where it is needed
 
+VALID_DECISIONS = frozenset({'BUY', 'SELL', 'HOLD'})
+
+# Explicit decision markers in order of preference (matched against upper-cased text)
+DECISION_MARKER_PATTERNS = (
+    # 1. "Action:" in FINAL EXECUTION PARAMETERS (highest priority)
+    re.compile(r'\bACTION\s*:\s*\*?\*?([A-Z]+)\*?\*?'),
+    # 2. "FINAL DECISION:"
+    re.compile(r'\bFINAL\s+DECISION\s*:\s*\*?\*?([A-Z]+)\*?\*?'),
+    # 3. "Decision:" fallback
+    re.compile(r'\bDECISION\s*:\s*\*?\*?([A-Z]+)\*?\*?'),
+)
+
+
 class QuietModeReporter:
     """Generates clean markdown reports with minimal output."""
 
@@ -61,39 +74,14 @@ class QuietModeReporter:
 
         # Look for explicit decision markers in order of preference
         # Use UPPER CASE matching since we upper() the input string
-
-        # 1. "Action:" in FINAL EXECUTION PARAMETERS (highest priority)
-        action_match = re.search(
-            r'\bACTION\s*:\s*\*?\*?([A-Z]+)\*?\*?',
-            final_decision.upper()
-        )
-        if action_match:
-            decision = action_match.group(1)
-            if decision in ['BUY', 'SELL', 'HOLD']:
-                return decision
-
-        # 2. "FINAL DECISION:"
-        final_decision_match = re.search(
-            r'\bFINAL\s+DECISION\s*:\s*\*?\*?([A-Z]+)\*?\*?',
-            final_decision.upper()
-        )
-        if final_decision_match:
-            decision = final_decision_match.group(1)
-            if decision in ['BUY', 'SELL', 'HOLD']:
-                return decision
-
-        # 3. "Decision:" fallback
-        decision_match = re.search(
-            r'\bDECISION\s*:\s*\*?\*?([A-Z]+)\*?\*?',
-            final_decision.upper()
-        )
-        if decision_match:
-            decision = decision_match.group(1)
-            if decision in ['BUY', 'SELL', 'HOLD']:
-                return decision
+        upper_decision = final_decision.upper()
+        for pattern in DECISION_MARKER_PATTERNS:
+            match = pattern.search(upper_decision)
+            if match and match.group(1) in VALID_DECISIONS:
+                return match.group(1)
 
         # 4. Generic keyword search (risky, but better than nothing)
-        generic_match = re.search(r'\b(BUY|SELL|HOLD)\b', final_decision.upper())
+        generic_match = re.search(r'\b(BUY|SELL|HOLD)\b', upper_decision)
         if generic_match:
             decision = generic_match.group(1)
             return decision
@@ -121,11 +109,11 @@ class QuietModeReporter:
                 return self._clean_text(rationale)
 
         # Fallback: if no specific section found, look for paragraph after decision statement
-        decision_keywords = ['BUY', 'SELL', 'HOLD']
         lines = final_decision.split('\n')
 
         for i, line in enumerate(lines):
-            if any(keyword in line.upper() for keyword in decision_keywords):
+            upper_line = line.upper()
+            if any(keyword in upper_line for keyword in VALID_DECISIONS):
                 # Get next non-empty lines as rationale
                 rationale_lines = []
                 for j in range(i+1, min(i+6, len(lines))):
@@ -10,7 +10,22 @@ class StockTwitsAPI:
     No API key is required for public stream access, but rate limits apply.
     """
     BASE_URL = "https://api.stocktwits.com/api/2"
-    
+
+    def __init__(self):
+        # Shared keep-alive session, created lazily on first request so repeated
+        # lookups reuse the pooled TCP/TLS connection instead of reconnecting.
+        self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
     async def get_sentiment(self, ticker: str) -> Dict[str, Any]:
         """
         Fetch the last 30 messages for a ticker and calculate sentiment.
@@ -32,24 +47,24 @@ class StockTwitsAPI:
             "User-Agent": "Mozilla/5.0 (compatible; TradingBot/1.0)"
         }
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    if response.status == 404:
-                        return {"error": "Symbol not found on StockTwits"}
-                    if response.status == 429:
-                        return {"error": "Rate limit exceeded"}
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}"}
-                    
-                    data = await response.json()
-                    messages = data.get('messages', [])
-                    
-                    return self._process_messages(messages, clean_ticker)
-                    
-            except Exception as e:
-                logger.error("stocktwits_fetch_failed", ticker=ticker, error=str(e))
-                return {"error": str(e)}
+        try:
+            session = await self._get_session()
+            async with session.get(url, headers=headers, timeout=10) as response:
+                if response.status == 404:
+                    return {"error": "Symbol not found on StockTwits"}
+                if response.status == 429:
+                    return {"error": "Rate limit exceeded"}
+                if response.status != 200:
+                    return {"error": f"HTTP {response.status}"}
+                
+                data = await response.json()
+                messages = data.get('messages', [])
+                
+                return self._process_messages(messages, clean_ticker)
+                
+        except Exception as e:
+            logger.error("stocktwits_fetch_failed", ticker=ticker, error=str(e))
+            return {"error": str(e)}
 
     def _process_messages(self, messages: List[Dict], ticker: str) -> Dict[str, Any]:
         """Analyze messages for Bullish/Bearish tags."""
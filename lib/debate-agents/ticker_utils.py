@@ -20,6 +20,13 @@ LEGAL_SUFFIXES = [
     r"\s+Pty", r"\s+Pte", r"\s+S\.p\.A\.", r"\s+SA\/NV"
 ]
 
+# Compiled once: longest first so "Public Limited Company" is stripped before "Company"
+LEGAL_SUFFIX_PATTERNS = tuple(
+    re.compile(suffix + '$', re.IGNORECASE)
+    for suffix in sorted(LEGAL_SUFFIXES, key=len, reverse=True)
+)
+PARENTHETICAL_PATTERN = re.compile(r'\s*\(.*?\)')
+
 def normalize_company_name(raw_name: str) -> str:
     """
     Dynamically strips legal fluff to isolate the 'Semantic Core' of the name.
@@ -37,17 +44,15 @@ def normalize_company_name(raw_name: str) -> str:
     
     # 1. Remove text inside parentheses (often legal descriptors or stock codes)
     # e.g. "Tencent Holdings (0700)" -> "Tencent Holdings"
-    clean_name = re.sub(r'\s*\(.*?\)', '', clean_name)
+    clean_name = PARENTHETICAL_PATTERN.sub('', clean_name)
     
     # 2. Iteratively strip legal suffixes (case insensitive)
     # We loop because sometimes they stack (e.g. "Group Holdings Ltd")
-    # We sort suffixes by length (desc) to catch "Public Limited Company" before "Company"
-    sorted_suffixes = sorted(LEGAL_SUFFIXES, key=len, reverse=True)
-    
+    # Suffixes are pre-sorted by length (desc) in LEGAL_SUFFIX_PATTERNS
     original = clean_name
     for _ in range(2): # Run twice to catch stacked suffixes
-        for suffix in sorted_suffixes:
-            clean_name = re.sub(suffix + '$', '', clean_name, flags=re.IGNORECASE)
+        for pattern in LEGAL_SUFFIX_PATTERNS:
+            clean_name = pattern.sub('', clean_name)
             
     clean_name = clean_name.strip()
     
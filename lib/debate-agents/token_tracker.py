@@ -13,6 +13,65 @@ from langchain_core.outputs import LLMResult
 
 logger = structlog.get_logger(__name__)
 
+SEPARATOR = "=" * 80
+SUBSEPARATOR = "-" * 80
+
+# LLM pricing (per 1M tokens)
+# IMPORTANT: Order matters! More specific models must come before general ones
+MODEL_PRICING = {
+    # OpenAI GPT-4 models (used by consultant node)
+    # Pricing as of Dec 2025: https://openai.com/api/pricing/
+    # Note: gpt-4o-mini must come BEFORE gpt-4o due to prefix matching
+    "gpt-4o-mini": {
+        "prompt": 0.15,     # $0.15 per 1M input tokens
+        "completion": 0.60  # $0.60 per 1M output tokens
+    },
+    "gpt-4o": {
+        "prompt": 2.50,     # $2.50 per 1M input tokens
+        "completion": 10.00 # $10.00 per 1M output tokens
+    },
+    "gpt-4-turbo": {
+        "prompt": 10.00,    # $10.00 per 1M input tokens
+        "completion": 30.00 # $30.00 per 1M output tokens
+    },
+    "gpt-4": {
+        "prompt": 30.00,    # $30.00 per 1M input tokens
+        "completion": 60.00 # $60.00 per 1M output tokens
+    },
+    # Gemini pricing - PAID TIER RATES
+    # NOTE: These apply when billing is enabled on your GCP project
+    # Gemini 2.0 Flash variants (experimental - but PAID if billing enabled)
+    "gemini-2.0-flash-thinking-exp": {
+        "prompt": 0.30,     # Paid tier: $0.30 per 1M input tokens
+        "completion": 2.50  # Paid tier: $2.50 per 1M output tokens
+    },
+    "gemini-2.0-flash-exp": {
+        "prompt": 0.30,     # Paid tier: $0.30 per 1M input tokens
+        "completion": 2.50  # Paid tier: $2.50 per 1M output tokens
+    },
+    # Gemini 2.5 Flash variants (more specific must come first!)
+    "gemini-2.5-flash-lite": {
+        "prompt": 0.10,     # $0.10 per 1M input tokens
+        "completion": 0.40  # $0.40 per 1M output tokens
+    },
+    "gemini-2.5-flash": {
+        "prompt": 0.30,     # $0.30 per 1M input tokens
+        "completion": 2.50  # $2.50 per 1M output tokens
+    },
+    # Gemini 3 Pro variants
+    "gemini-3-pro-preview": {
+        "prompt": 2.00,     # $2.00 per 1M input tokens
+        "completion": 12.00 # $12.00 per 1M output tokens
+    },
+    "gemini-3-pro": {
+        "prompt": 2.00,     # $2.00 per 1M input tokens (< 200k context)
+        "completion": 12.00 # $12.00 per 1M output tokens (< 200k context)
+    },
+}
+
+# Default pricing for unknown models (assume Flash-level pricing)
+DEFAULT_PRICING = {"prompt": 0.30, "completion": 2.50}
+
 
 @dataclass
 class TokenUsage:
@@ -33,66 +92,11 @@ class TokenUsage:
         regardless of model name or "free tier" marketing. These are paid tier rates.
 
         Updated for Dec 2025 pricing (sources: ai.google.dev/gemini-api/docs/pricing).
+        See MODEL_PRICING for per-model rates.
         """
-        # LLM pricing (per 1M tokens)
-        # IMPORTANT: Order matters! More specific models must come before general ones
-        pricing = {
-            # OpenAI GPT-4 models (used by consultant node)
-            # Pricing as of Dec 2025: https://openai.com/api/pricing/
-            # Note: gpt-4o-mini must come BEFORE gpt-4o due to prefix matching
-            "gpt-4o-mini": {
-                "prompt": 0.15,     # $0.15 per 1M input tokens
-                "completion": 0.60  # $0.60 per 1M output tokens
-            },
-            "gpt-4o": {
-                "prompt": 2.50,     # $2.50 per 1M input tokens
-                "completion": 10.00 # $10.00 per 1M output tokens
-            },
-            "gpt-4-turbo": {
-                "prompt": 10.00,    # $10.00 per 1M input tokens
-                "completion": 30.00 # $30.00 per 1M output tokens
-            },
-            "gpt-4": {
-                "prompt": 30.00,    # $30.00 per 1M input tokens
-                "completion": 60.00 # $60.00 per 1M output tokens
-            },
-            # Gemini pricing - PAID TIER RATES
-            # NOTE: These apply when billing is enabled on your GCP project
-            # Gemini 2.0 Flash variants (experimental - but PAID if billing enabled)
-            "gemini-2.0-flash-thinking-exp": {
-                "prompt": 0.30,     # Paid tier: $0.30 per 1M input tokens
-                "completion": 2.50  # Paid tier: $2.50 per 1M output tokens
-            },
-            "gemini-2.0-flash-exp": {
-                "prompt": 0.30,     # Paid tier: $0.30 per 1M input tokens
-                "completion": 2.50  # Paid tier: $2.50 per 1M output tokens
-            },
-            # Gemini 2.5 Flash variants (more specific must come first!)
-            "gemini-2.5-flash-lite": {
-                "prompt": 0.10,     # $0.10 per 1M input tokens
-                "completion": 0.40  # $0.40 per 1M output tokens
-            },
-            "gemini-2.5-flash": {
-                "prompt": 0.30,     # $0.30 per 1M input tokens
-                "completion": 2.50  # $2.50 per 1M output tokens
-            },
-            # Gemini 3 Pro variants
-            "gemini-3-pro-preview": {
-                "prompt": 2.00,     # $2.00 per 1M input tokens
-                "completion": 12.00 # $12.00 per 1M output tokens
-            },
-            "gemini-3-pro": {
-                "prompt": 2.00,     # $2.00 per 1M input tokens (< 200k context)
-                "completion": 12.00 # $12.00 per 1M output tokens (< 200k context)
-            },
-        }
-
-        # Default pricing for unknown models (assume Flash-level pricing)
-        default_pricing = {"prompt": 0.30, "completion": 2.50}
-
         # Find pricing for this model (match by prefix)
-        model_pricing = default_pricing
-        for model_key, prices in pricing.items():
+        model_pricing = DEFAULT_PRICING
+        for model_key, prices in MODEL_PRICING.items():
             if self.model_name.startswith(model_key):
                 model_pricing = prices
                 break
@@ -238,9 +242,9 @@ class TokenTracker:
         stats = self.get_total_stats()
 
         logger.info(
-            "=" * 80 + "\n" +
+            SEPARATOR + "\n" +
             "TOKEN USAGE SUMMARY\n" +
-            "=" * 80
+            SEPARATOR
         )
         logger.info(f"Session Start: {stats['session_start']}")
         logger.info(f"Total LLM Calls: {stats['total_calls']}")
@@ -251,7 +255,7 @@ class TokenTracker:
         logger.info(f"Projected Cost (Paid Tier): ${stats['total_cost_usd']:.4f} USD")
         logger.info("  (Note: Actual cost = $0 if using free tier without billing enabled)")
         logger.info("\nPer-Agent Breakdown:")
-        logger.info("-" * 80)
+        logger.info(SUBSEPARATOR)
 
         # Sort agents by cost (descending)
         sorted_agents = sorted(
@@ -270,7 +274,7 @@ class TokenTracker:
                 f"  Cost: ${agent_stats['cost_usd']:.4f}"
             )
 
-        logger.info("=" * 80)
+        logger.info(SEPARATOR)
 
 
 class TokenTrackingCallback(BaseCallbackHandler):
@@ -299,30 +303,27 @@ class TokenTrackingCallback(BaseCallbackHandler):
         model_name = "unknown"
 
         # Try to get usage from generations first (Gemini's structure)
-        if response.generations and len(response.generations) > 0:
-            first_generation_list = response.generations[0]
-            if first_generation_list and len(first_generation_list) > 0:
-                first_generation = first_generation_list[0]
-
-                # Check if it's an AIMessage with usage_metadata
-                if hasattr(first_generation, 'message') and hasattr(first_generation.message, 'usage_metadata'):
-                    usage_metadata = first_generation.message.usage_metadata or {}
-
-                # Get model name from generation_info or response_metadata
-                if hasattr(first_generation, 'generation_info'):
-                    model_name = first_generation.generation_info.get('model_name', 'unknown')
-                if model_name == 'unknown' and hasattr(first_generation, 'message'):
-                    if hasattr(first_generation.message, 'response_metadata'):
-                        model_name = first_generation.message.response_metadata.get('model_name', 'unknown')
+        if response.generations and response.generations[0]:
+            first_generation = response.generations[0][0]
+            message = getattr(first_generation, 'message', None)
+
+            # Check if it's an AIMessage with usage_metadata
+            usage_metadata = getattr(message, 'usage_metadata', None) or {}
+
+            # Get model name from generation_info or response_metadata
+            generation_info = getattr(first_generation, 'generation_info', None) or {}
+            model_name = generation_info.get('model_name', 'unknown')
+            if model_name == 'unknown':
+                response_metadata = getattr(message, 'response_metadata', None) or {}
+                model_name = response_metadata.get('model_name', 'unknown')
 
         # Fallback to llm_output (for other LLM providers)
-        if not usage_metadata and response.llm_output:
-            usage_metadata = response.llm_output.get("usage_metadata", {})
-            if not usage_metadata:
-                # Fallback to deprecated token_usage field
-                usage_metadata = response.llm_output.get("token_usage", {})
+        llm_output = response.llm_output
+        if not usage_metadata and llm_output:
+            # Fallback to deprecated token_usage field
+            usage_metadata = llm_output.get("usage_metadata") or llm_output.get("token_usage", {})
             if model_name == "unknown":
-                model_name = response.llm_output.get("model_name", "unknown")
+                model_name = llm_output.get("model_name", "unknown")
 
         if usage_metadata:
             prompt_tokens = usage_metadata.get("input_tokens", 0) or usage_metadata.get("prompt_tokens", 0)
@@ -8,6 +8,7 @@ import os
 import asyncio
 import math
 import html
+import time
 from typing import Any, Annotated, List, Dict, Optional
 import pandas as pd
 import structlog
@@ -47,6 +48,55 @@ except ImportError:
         except ImportError:
             logger.warning("Tavily tools not available. Install langchain-tavily or langchain-community.")
 
+# News and fundamentals analysts often issue identical Tavily queries within a run
+# (get_news is in both toolsets); reuse results instead of re-querying
+TAVILY_CACHE_TTL_SECONDS = 900
+_tavily_cache: Dict[str, tuple] = {}
+
+def _is_cacheable_tavily_result(result: Any) -> bool:
+    """Only real hits are cacheable; failures come back as an error dict or a repr string."""
+    if isinstance(result, list):
+        return bool(result)
+    if isinstance(result, dict):
+        return "error" not in result and bool(result.get("results"))
+    return False
+
+async def _cached_tavily_search(query: str) -> Any:
+    """Run a Tavily query, serving repeats of the same query from a short-lived cache."""
+    key = " ".join(query.split())
+    cached = _tavily_cache.get(key)
+    if cached and time.monotonic() - cached[1] < TAVILY_CACHE_TTL_SECONDS:
+        logger.debug("tavily_cache_hit", query=query[:80])
+        return cached[0]
+
+    result = await tavily_tool.ainvoke({"query": query})
+    if _is_cacheable_tavily_result(result):
+        # Evict expired entries so long-lived processes don't accumulate stale results
+        now = time.monotonic()
+        for stale_key in [k for k, (_, ts) in _tavily_cache.items() if now - ts >= TAVILY_CACHE_TTL_SECONDS]:
+            del _tavily_cache[stale_key]
+        _tavily_cache[key] = (result, now)
+    return result
+
+def _drop_seen_urls(search_result: Any, seen_urls: set) -> Any:
+    """Remove Tavily hits whose URL was already returned by an earlier query."""
+    items = search_result.get("results") if isinstance(search_result, dict) else search_result
+    if not isinstance(items, list):
+        return search_result
+
+    unique = []
+    for item in items:
+        url = item.get("url") if isinstance(item, dict) else None
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        unique.append(item)
+
+    if isinstance(search_result, dict):
+        return {**search_result, "results": unique} if unique else None
+    return unique
+
 async def fetch_with_timeout(coroutine, timeout_seconds=10, error_msg="Timeout"):
     try:
         return await asyncio.wait_for(coroutine, timeout=timeout_seconds)
@@ -110,12 +160,20 @@ def _safe_float(value: Any) -> Optional[float]:
     except (ValueError, TypeError):
         return None
 
-def _format_val(value: Any, fmt: str = "{:.2f}", default: str = "N/A") -> str:
-    """Format a value safely, returning default if invalid."""
+def _format_val(value: Any, spec: str = ".2f", default: str = "N/A") -> str:
+    """Format a value safely with a format spec, returning default if invalid."""
     val = _safe_float(value)
     if val is None:
         return default
-    return fmt.format(val)
+    return format(val, spec)
+
+def _fmt_pct(value: Any) -> str:
+    """Format a ratio as a percentage."""
+    return _format_val(value, ".2%")
+
+def _fmt_lrg(value: Any) -> str:
+    """Format a large number with thousands separators."""
+    return _format_val(value, ",.0f")
 
 # --- DATA TOOLS ---
 
@@ -138,15 +196,6 @@ async def get_financial_metrics(ticker: Annotated[str, "Stock ticker symbol"]) -
         currency = data.get('currency', 'N/A')
         analyst_count = data.get('numberOfAnalystOpinions')
         
-        # Helper for percentage formatting
-        def fmt_pct(val): return _format_val(val, "{:.2%}")
-        
-        # Helper for standard float formatting
-        def fmt_flt(val): return _format_val(val, "{:.2f}")
-        
-        # Helper for large numbers
-        def fmt_lrg(val): return _format_val(val, "{:,.0f}")
-
         price_str = f"{current_price:.2f}" if current_price is not None else "N/A"
 
         report_lines = [
@@ -155,30 +204,30 @@ async def get_financial_metrics(ticker: Annotated[str, "Stock ticker symbol"]) -
             f"Data Source: {data.get('_data_source', 'unknown')}",
             "",
             "### PROFITABILITY",
-            f"- ROE: {fmt_pct(data.get('returnOnEquity'))}",
-            f"- ROA: {fmt_pct(data.get('returnOnAssets'))}",
-            f"- Op Margin: {fmt_pct(data.get('operatingMargins'))}",
+            f"- ROE: {_fmt_pct(data.get('returnOnEquity'))}",
+            f"- ROA: {_fmt_pct(data.get('returnOnAssets'))}",
+            f"- Op Margin: {_fmt_pct(data.get('operatingMargins'))}",
             "",
             "### LEVERAGE & HEALTH",
-            f"- Debt/Equity: {fmt_flt(data.get('debtToEquity'))}",
-            f"- Current Ratio: {fmt_flt(data.get('currentRatio'))}",
-            f"- Total Cash: {fmt_lrg(data.get('totalCash'))}",
-            f"- Total Debt: {fmt_lrg(data.get('totalDebt'))}",
+            f"- Debt/Equity: {_format_val(data.get('debtToEquity'))}",
+            f"- Current Ratio: {_format_val(data.get('currentRatio'))}",
+            f"- Total Cash: {_fmt_lrg(data.get('totalCash'))}",
+            f"- Total Debt: {_fmt_lrg(data.get('totalDebt'))}",
             "",
             "### CASH FLOW",
-            f"- Operating Cash Flow: {fmt_lrg(data.get('operatingCashflow'))}",
-            f"- Free Cash Flow: {fmt_lrg(data.get('freeCashflow'))}",
+            f"- Operating Cash Flow: {_fmt_lrg(data.get('operatingCashflow'))}",
+            f"- Free Cash Flow: {_fmt_lrg(data.get('freeCashflow'))}",
             "",
             "### GROWTH",
-            f"- Revenue Growth (YoY): {fmt_pct(data.get('revenueGrowth'))}",
-            f"- Earnings Growth: {fmt_pct(data.get('earningsGrowth'))}",
-            f"- Gross Margin: {fmt_pct(data.get('grossMargins'))}",
+            f"- Revenue Growth (YoY): {_fmt_pct(data.get('revenueGrowth'))}",
+            f"- Earnings Growth: {_fmt_pct(data.get('earningsGrowth'))}",
+            f"- Gross Margin: {_fmt_pct(data.get('grossMargins'))}",
             "",
             "### VALUATION",
-            f"- P/E (TTM): {fmt_flt(data.get('trailingPE'))}",
-            f"- Forward P/E: {fmt_flt(data.get('forwardPE'))}",
-            f"- P/B Ratio: {fmt_flt(data.get('priceToBook'))}",
-            f"- PEG Ratio: {fmt_flt(data.get('pegRatio'))}",
+            f"- P/E (TTM): {_format_val(data.get('trailingPE'))}",
+            f"- Forward P/E: {_format_val(data.get('forwardPE'))}",
+            f"- P/B Ratio: {_format_val(data.get('priceToBook'))}",
+            f"- PEG Ratio: {_format_val(data.get('pegRatio'))}",
             "",
             "### ANALYST COVERAGE",
             f"- Analyst Opinions: {analyst_count}" if analyst_count is not None else "- Analyst Opinions: Data Unavailable",
@@ -218,35 +267,36 @@ async def get_news(
             suffix = "." + normalized_symbol.split(".")[-1]
         local_hint = local_source_hints.get(suffix, "")
         
-        results = []
-        
+        async def _search(query: str, label: str) -> Any:
+            try:
+                return await _cached_tavily_search(query)
+            except Exception as e:
+                logger.warning(f"{label} news search failed: {e}")
+            return None
+
         # 1. General Search - Use Clean Name
         general_query = f'"{company_name}" {search_query}' if search_query else f'"{company_name}" (earnings OR merger OR acquisition OR regulatory)'
-        try:
-            general_result = await tavily_tool.ainvoke({"query": general_query})
-            if general_result:
-                # Sanitize and truncate output to prevent context overflow
-                sanitized = html.escape(str(general_result))
-                if len(sanitized) > 15000:
-                    sanitized = sanitized[:15000] + "... [truncated]"
-                results.append(f"=== GENERAL NEWS ===\n{sanitized}\n")
-        except Exception as e:
-            logger.warning(f"General news search failed: {e}")
-        
+        searches = [(general_query, "GENERAL NEWS", "General")]
+
         # 2. Local Search - Use Clean Name
         if local_hint and not search_query:
             local_query = f'"{company_name}" {local_hint} (earnings OR guidance OR strategy)'
-            try:
-                local_result = await tavily_tool.ainvoke({"query": local_query})
-                if local_result:
-                    # Sanitize and truncate
-                    sanitized_local = html.escape(str(local_result))
-                    if len(sanitized_local) > 15000:
-                        sanitized_local = sanitized_local[:15000] + "... [truncated]"
-                    results.append(f"=== LOCAL/REGIONAL NEWS SOURCES ===\n{sanitized_local}\n")
-            except Exception as e:
-                logger.warning(f"Local news search failed: {e}")
-                
+            searches.append((local_query, "LOCAL/REGIONAL NEWS SOURCES", "Local"))
+
+        # Queries are independent - run them concurrently, keeping general-first order
+        raw_results = await asyncio.gather(*(_search(query, label) for query, _, label in searches))
+
+        results = []
+        seen_urls: set = set()
+        for (_, header, _), search_result in zip(searches, raw_results):
+            search_result = _drop_seen_urls(search_result, seen_urls)
+            if search_result:
+                # Sanitize and truncate output to prevent context overflow
+                sanitized = html.escape(str(search_result))
+                if len(sanitized) > 15000:
+                    sanitized = sanitized[:15000] + "... [truncated]"
+                results.append(f"=== {header} ===\n{sanitized}\n")
+
         if not results:
             return f"No news found for {company_name}."
             
@@ -284,17 +334,15 @@ async def get_technical_indicators(symbol: str) -> str:
         sma_200 = _safe_float(stock['close_200_sma'].iloc[-1])
         
         # Format with safety checks
-        def fmt(val): return _format_val(val)
-        
         return (
             f"Technical Indicators for {symbol}:\n"
-            f"Current Price: {fmt(latest['Close'])}\n"
-            f"RSI (14): {fmt(stock['rsi_14'].iloc[-1])}\n"
-            f"MACD: {fmt(stock['macd'].iloc[-1])}\n"
-            f"SMA 50: {fmt(sma_50)}\n"
-            f"SMA 200: {fmt(sma_200)}\n"
-            f"Bollinger Upper: {fmt(stock['boll_ub'].iloc[-1])}\n"
-            f"Bollinger Lower: {fmt(stock['boll_lb'].iloc[-1])}"
+            f"Current Price: {_format_val(latest['Close'])}\n"
+            f"RSI (14): {_format_val(stock['rsi_14'].iloc[-1])}\n"
+            f"MACD: {_format_val(stock['macd'].iloc[-1])}\n"
+            f"SMA 50: {_format_val(sma_50)}\n"
+            f"SMA 200: {_format_val(sma_200)}\n"
+            f"Bollinger Upper: {_format_val(stock['boll_ub'].iloc[-1])}\n"
+            f"Bollinger Lower: {_format_val(stock['boll_lb'].iloc[-1])}"
         )
     except Exception as e: return f"Error: {e}"
     
@@ -312,7 +360,7 @@ async def get_social_media_sentiment(ticker: str) -> str:
 async def get_macroeconomic_news(trade_date: str) -> str:
     """Get macroeconomic news context for a specific date."""
     if not tavily_tool: return "Tool unavailable"
-    return str(await tavily_tool.ainvoke({"query": f"macroeconomic news {trade_date}"}))
+    return str(await _cached_tavily_search(f"macroeconomic news {trade_date}"))
 
 @tool
 async def get_fundamental_analysis(ticker: Annotated[str, "Stock ticker symbol"]) -> str:
@@ -335,7 +383,7 @@ async def get_fundamental_analysis(ticker: Annotated[str, "Stock ticker symbol"]
         # 1. Primary Search: Ticker-based (Most specific to the listing)
         # Use strict quoting for the ticker name if we have it, otherwise just ticker
         ticker_query = f"{ticker} stock analyst coverage count consensus rating American Depositary Receipt exchange listing ADR status"
-        ticker_results = await tavily_tool.ainvoke({"query": ticker_query})
+        ticker_results = await _cached_tavily_search(ticker_query)
         ticker_results_str = str(ticker_results)
         
         # Check result quality
@@ -347,7 +395,7 @@ async def get_fundamental_analysis(ticker: Annotated[str, "Stock ticker symbol"]
             if company_name and company_name != ticker:
                 # Use quoted company name for strictness
                 name_query = f'"{company_name}" stock analyst coverage count consensus rating American Depositary Receipt ADR status'
-                name_results = await tavily_tool.ainvoke({"query": name_query})
+                name_results = await _cached_tavily_search(name_query)
                 return (
                     f"Fundamental Search Results for {company_name} ({ticker}) [Source: Fallback Name Search]:\n"
                     f"{name_results}\n\n"
@@ -365,7 +413,7 @@ async def get_fundamental_analysis(ticker: Annotated[str, "Stock ticker symbol"]
             # Run a targeted "Surgical" search just for the ADR
             # Use quoted company name
             adr_query = f'"{company_name}" American Depositary Receipt ADR ticker status'
-            adr_results = await tavily_tool.ainvoke({"query": adr_query})
+            adr_results = await _cached_tavily_search(adr_query)
             adr_results_str = str(adr_results)
             
             # Only append if the surgical search actually found something relevant to avoid noise
@@ -14,6 +14,10 @@ from src.agents import AgentState
 
 logger = structlog.get_logger(__name__)
 
+# Signals the Portfolio Manager is allowed to emit
+VALID_SIGNALS = frozenset({"BUY", "SELL", "HOLD"})
+SIGNAL_PATTERN = re.compile(r'\b(BUY|SELL|HOLD)\b')
+
 class SignalProcessor:
     """
     Parses the final natural language output from the Portfolio Manager into a
@@ -29,7 +33,7 @@ class SignalProcessor:
         It first tries a robust regex and falls back to an LLM call if needed.
         """
         # 1. Try a robust regex first for efficiency and reliability
-        match = re.search(r'\b(BUY|SELL|HOLD)\b', full_signal.upper())
+        match = SIGNAL_PATTERN.search(full_signal.upper())
         if match:
             signal = match.group(1)
             logger.info("signal_extracted_via_regex", signal=signal)
@@ -45,7 +49,7 @@ class SignalProcessor:
             result = await self.llm.ainvoke(messages)
             content = result.content.strip().upper()
             
-            if content in ["BUY", "SELL", "HOLD"]:
+            if content in VALID_SIGNALS:
                 logger.info("signal_extracted_via_llm", signal=content)
                 return content
             